@@ -1,13 +1,53 @@
 """Generate a combined HTML report from all executed notebooks."""
 
+import base64
+import gzip
+import hashlib
+import io
+import itertools
 import json
-import uuid
+import mmap
+import multiprocessing
+import os
+import re
+import shutil
+import subprocess
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib decoder/encoder
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional; only the gzip variant is written without it
+    brotli = None
+
+try:
+    import minify_html
+except ImportError:  # optional; the report is written unminified without it
+    minify_html = None
+
+try:
+    import ijson
+except ImportError:  # optional; without it each notebook is loaded whole
+    ijson = None
+
 ROOT = Path(__file__).resolve().parent.parent
 NOTEBOOKS_DIR = ROOT / "notebooks"
 DOCS_DIR = ROOT / "docs"
 DOCS_DIR.mkdir(parents=True, exist_ok=True)
+IMAGES_DIR = DOCS_DIR / "images"
+IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = ROOT / ".cache" / "generate_html"
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Lossless PNG recompression, used only if oxipng is on PATH
+_OXIPNG = shutil.which("oxipng")
+
+# Bump whenever extract_outputs() output changes so cached fragments are rebuilt
+_CACHE_VERSION = 6
 
 NOTEBOOKS = [
     "01_data_collection.ipynb",
@@ -40,29 +80,413 @@ NOTEBOOKS = [
 ]
 
 
-def extract_outputs(nb_path: Path) -> str:
-    """Extract notebook outputs as HTML fragments directly from the .ipynb JSON."""
-    nb = json.loads(nb_path.read_text())
-    parts = []
+# Written to docs/report.css so browsers can cache it across visits
+_CSS = """\
+* {
+    box-sizing: border-box;
+}
+body {
+    font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background: #fafafa;
+    color: #333;
+}
+h1 {
+    text-align: center;
+    color: #2c3e50;
+    border-bottom: 3px solid #e74c3c;
+    padding-bottom: 15px;
+    font-size: clamp(1.4rem, 4vw, 2rem);
+}
+nav {
+    display: flex;
+    flex-wrap: wrap;
+    justify-content: center;
+    gap: 8px 16px;
+    margin: 20px 0 30px;
+    padding: 15px;
+    background: #fff;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+}
+nav a {
+    color: #e74c3c;
+    text-decoration: none;
+    font-weight: 600;
+    font-size: 14px;
+    white-space: nowrap;
+}
+nav a:hover {
+    text-decoration: underline;
+}
+.section-title {
+    color: #2c3e50;
+    border-left: 4px solid #e74c3c;
+    padding-left: 12px;
+    font-size: clamp(1.1rem, 3vw, 1.5rem);
+}
+section {
+    background: #fff;
+    padding: 25px;
+    margin: 20px 0;
+    border-radius: 8px;
+    box-shadow: 0 1px 3px rgba(0,0,0,0.1);
+    overflow: hidden;
+}
+.notebook-content img {
+    max-width: 100%;
+    height: auto;
+    display: block;
+    margin: 0 auto;
+}
+.output-text {
+    background: #f5f5f5;
+    padding: 10px;
+    border-radius: 4px;
+    overflow-x: auto;
+    font-size: 13px;
+    white-space: pre-wrap;
+    word-break: break-word;
+}
+.table-wrapper {
+    overflow-x: auto;
+    -webkit-overflow-scrolling: touch;
+    margin: 10px 0;
+}
+.notebook-content table {
+    border-collapse: collapse;
+    font-size: 13px;
+    min-width: 400px;
+}
+.notebook-content table th,
+.notebook-content table td {
+    border: 1px solid #ddd;
+    padding: 6px 10px;
+    text-align: right;
+    white-space: nowrap;
+}
+.notebook-content table th {
+    background: #f0f0f0;
+    position: sticky;
+    top: 0;
+    z-index: 1;
+}
+.output-image {
+    text-align: center;
+    margin: 15px 0;
+    overflow-x: auto;
+}
+.output-html {
+    margin: 15px 0;
+    overflow-x: auto;
+}
+hr {
+    border: none;
+    border-top: 1px solid #eee;
+    margin: 30px 0;
+}
+.plotly-graph-div {
+    margin: 15px 0;
+    min-height: 350px;
+}
+section[data-src] .notebook-content {
+    min-height: 200px;
+}
+footer {
+    text-align: center;
+    color: #999;
+    font-size: 13px;
+    margin-top: 40px;
+    padding: 20px;
+}
+@media (max-width: 768px) {
+    body {
+        padding: 10px;
+    }
+    section {
+        padding: 12px;
+        margin: 10px 0;
+        border-radius: 6px;
+    }
+    nav {
+        padding: 10px;
+        gap: 6px 12px;
+    }
+    nav a {
+        font-size: 13px;
+    }
+    .plotly-graph-div {
+        min-height: 300px;
+    }
+    .notebook-content table {
+        font-size: 11px;
+    }
+    .notebook-content table th,
+    .notebook-content table td {
+        padding: 4px 6px;
+    }
+    .output-text {
+        font-size: 11px;
+        padding: 8px;
+    }
+}
+"""
+
+_HTML_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🔫</text></svg>">
+<title>{title}</title>
+<link rel="stylesheet" href="report.css">
+<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
+</head>
+<body>
+"""
+
+_REPORT_TITLE = "Gun Violence Analysis — Full Report"
+
+_HTML_FOOT = """
+
+<footer>
+    Generated from Jupyter notebooks. Data sources: World Bank, UNODC, Census ACS, CDC WONDER, FBI UCR, RAND, Giffords Law Center, Gun Violence Archive, SAMHSA NSDUH.
+</footer>
+<script>
+(function () {
+    var config = {"responsive": true, "displayModeBar": false};
+    function render(div) {
+        var fig = JSON.parse(document.getElementById("data-" + div.id).textContent);
+        Plotly.newPlot(div.id, fig.data, fig.layout, config);
+    }
+    var lazy = "IntersectionObserver" in window;
+    var plotObserver = lazy && new IntersectionObserver(function (entries) {
+        entries.forEach(function (entry) {
+            if (entry.isIntersecting) {
+                plotObserver.unobserve(entry.target);
+                render(entry.target);
+            }
+        });
+    }, {rootMargin: "200px 0px"});
+    function observePlots(root) {
+        root.querySelectorAll(".plotly-graph-div").forEach(function (div) {
+            if (lazy) {
+                plotObserver.observe(div);
+            } else {
+                render(div);
+            }
+        });
+    }
+    // report.html only holds section shells; fetch each page as it nears the viewport
+    function loadSection(section) {
+        fetch(section.dataset.src)
+            .then(function (resp) { return resp.text(); })
+            .then(function (text) {
+                var page = new DOMParser().parseFromString(text, "text/html");
+                var content = section.querySelector(".notebook-content");
+                content.innerHTML = page.querySelector(".notebook-content").innerHTML;
+                observePlots(content);
+            });
+    }
+    var shells = document.querySelectorAll("section[data-src]");
+    if (lazy) {
+        var sectionObserver = new IntersectionObserver(function (entries) {
+            entries.forEach(function (entry) {
+                if (entry.isIntersecting) {
+                    sectionObserver.unobserve(entry.target);
+                    loadSection(entry.target);
+                }
+            });
+        }, {rootMargin: "600px 0px"});
+        shells.forEach(function (shell) { sectionObserver.observe(shell); });
+    } else {
+        shells.forEach(loadSection);
+    }
+    observePlots(document);
+})();
+</script>
+</body>
+</html>"""
+
+# Converts a whole markdown cell in one C-level re.sub pass; every line
+# (including its newline) is consumed, and blank lines collapse to nothing
+_MD_LINE = re.compile(
+    r"^(?:(?P<hashes>###|##|#) (?P<h>.*)"
+    r"|\*\*(?P<b>.*)\*\*"
+    r"|- (?P<li>.*)"
+    r"|(?P<p>.*\S.*)"
+    r"|(?P<blank>\s*?))$\n?",
+    re.M,
+)
+
+
+def _md_line_to_html(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind == "h":
+        tag = "h4" if len(m["hashes"]) == 3 else "h3"
+        return f"<{tag}>{m['h']}</{tag}>\n"
+    if kind == "b":
+        return f"<p><strong>{m['b']}</strong></p>\n"
+    if kind == "li":
+        return f"<li>{m['li']}</li>\n"
+    if kind == "p":
+        return f"<p>{m['p']}</p>\n"
+    return ""
+
+
+# Any markdown cell or any non-empty outputs list means the notebook has content
+_HAS_CONTENT = re.compile(rb'"cell_type":\s*"markdown"|"outputs":\s*\[\s*[^\s\]]')
+
+# Tables are tagged with a content hash so repeats can be collapsed in main()
+_TABLE_BLOCK = re.compile(
+    r'<div class="table-wrapper" id="tbl-(?P<h>[0-9a-f]{16})">.*?</div><!--/tbl-(?P=h)-->',
+    re.S,
+)
+
+# Image files a fragment links to; they live in docs/images/, outside the cache
+_IMG_REF = re.compile(r'<img src="images/([0-9a-f]{16}\.png)"')
+
+
+def _json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(obj) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+# Defaults folded under each figure's own layout (figure values win)
+_DEFAULT_LAYOUT = {"autosize": True, "margin": {"l": 10, "r": 10, "t": 40, "b": 10}}
+
+# Line traces longer than this are downsampled with LTTB before embedding
+_LTTB_THRESHOLD = 2000
+_LTTB_TARGET = 1500
+
+# Notebooks larger than this are stream-parsed even when orjson is available
+_STREAM_THRESHOLD = 256 * 1024 * 1024
+
+
+def _lttb(x: list, y: list, n_out: int) -> list:
+    """Largest-Triangle-Three-Buckets: indices of ``n_out`` visually significant points."""
+    n = len(x)
+    bucket = (n - 2) / (n_out - 2)
+    keep = [0]
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * bucket) + 1
+        end = int((i + 1) * bucket) + 1
+        # Average of the next bucket is the third triangle vertex
+        nxt_end = min(int((i + 2) * bucket) + 1, n)
+        span = nxt_end - end
+        avg_x = sum(x[end:nxt_end]) / span
+        avg_y = sum(y[end:nxt_end]) / span
+        ax, ay = x[a], y[a]
+        best, best_area = start, -1.0
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y[j] - ay) - (ax - x[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        keep.append(best)
+        a = best
+    keep.append(n - 1)
+    return keep
+
+
+def _has_point_array(obj: dict, n: int) -> bool:
+    """True if ``obj`` or any dict nested in it holds an ``n``-long list or a typed array."""
+    if "bdata" in obj:
+        return True
+    for val in obj.values():
+        if isinstance(val, list) and len(val) == n:
+            return True
+        if isinstance(val, dict) and _has_point_array(val, n):
+            return True
+    return False
+
+
+def _downsample_trace(trace: dict) -> None:
+    """Downsample a long line trace in place; other traces are left untouched."""
+    if trace.get("type", "scatter") not in ("scatter", "scattergl"):
+        return
+    if "lines" not in trace.get("mode", "lines"):
+        return
+    x, y = trace.get("x"), trace.get("y")
+    # Typed-array ("bdata") encodings and mismatched lengths are skipped
+    if not isinstance(x, list) or not isinstance(y, list) or len(x) != len(y):
+        return
+    if len(x) <= _LTTB_THRESHOLD:
+        return
+    if not all(isinstance(v, (int, float)) for v in x + y):
+        return
+    # Any other per-point array, top-level or nested such as marker.color or
+    # error_y.array, would fall out of alignment with x/y
+    rest = {key: val for key, val in trace.items() if key not in ("x", "y")}
+    if _has_point_array(rest, len(x)):
+        return
+    keep = _lttb(x, y, _LTTB_TARGET)
+    trace["x"] = [x[i] for i in keep]
+    trace["y"] = [y[i] for i in keep]
+
 
-    for cell in nb.get("cells", []):
+def _optimize_png(raw: bytes) -> bytes:
+    """Losslessly recompress a PNG with oxipng, returning the input on any failure."""
+    if _OXIPNG is None:
+        return raw
+    result = subprocess.run(
+        [_OXIPNG, "-o4", "--strip", "safe", "--stdout", "-"],
+        input=raw,
+        capture_output=True,
+    )
+    if result.returncode != 0 or not result.stdout:
+        return raw
+    return result.stdout
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write-then-rename, so an interrupted run never leaves a truncated file behind."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _has_content(nb_path: Path) -> bool:
+    """Cheap byte-level scan so unexecuted notebooks skip the JSON parse entirely."""
+    if nb_path.stat().st_size == 0:
+        return False
+    with nb_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _HAS_CONTENT.search(mm) is not None
+
+
+def _iter_cells(nb_path: Path):
+    """Yield notebook cells one at a time.
+
+    orjson parses a whole notebook about twice as fast as ijson streams it, so
+    ijson is used only without orjson or for notebooks past _STREAM_THRESHOLD,
+    where holding one cell (and its base64/Plotly payloads) at a time matters.
+    """
+    if ijson is not None and (orjson is None or nb_path.stat().st_size > _STREAM_THRESHOLD):
+        with nb_path.open("rb") as f:
+            yield from ijson.items(f, "cells.item", use_float=True)
+    else:
+        yield from _json_loads(nb_path.read_bytes()).get("cells", [])
+
+
+def extract_outputs(nb_path: Path, out: io.StringIO) -> None:
+    """Write notebook outputs as HTML fragments to ``out``, directly from the .ipynb JSON."""
+    # Notebook names are unique, so stem + counter gives page-unique, stable div ids
+    plot_ids = itertools.count()
+    if not _has_content(nb_path):
+        return
+    for cell in _iter_cells(nb_path):
         if cell["cell_type"] == "markdown":
             source = "".join(cell.get("source", []))
-            html_lines = []
-            for line in source.split("\n"):
-                if line.startswith("### "):
-                    html_lines.append(f"<h4>{line[4:]}</h4>")
-                elif line.startswith("## "):
-                    html_lines.append(f"<h3>{line[3:]}</h3>")
-                elif line.startswith("# "):
-                    html_lines.append(f"<h3>{line[2:]}</h3>")
-                elif line.startswith("**") and line.endswith("**"):
-                    html_lines.append(f"<p><strong>{line[2:-2]}</strong></p>")
-                elif line.startswith("- "):
-                    html_lines.append(f"<li>{line[2:]}</li>")
-                elif line.strip():
-                    html_lines.append(f"<p>{line}</p>")
-            parts.append("\n".join(html_lines))
+            out.write(_MD_LINE.sub(_md_line_to_html, source))
             continue
 
         if cell["cell_type"] != "code":
@@ -76,253 +500,207 @@ def extract_outputs(nb_path: Path) -> str:
 
                 if "application/vnd.plotly.v1+json" in data:
                     plotly_data = data["application/vnd.plotly.v1+json"]
-                    div_id = f"plotly-{uuid.uuid4().hex[:12]}"
-                    fig_data = json.dumps(plotly_data.get("data", []))
+                    div_id = f"plotly-{nb_path.stem}-{next(plot_ids)}"
+                    for trace in plotly_data.get("data", []):
+                        _downsample_trace(trace)
                     layout = plotly_data.get("layout", {})
-                    layout.setdefault("autosize", True)
-                    layout.setdefault("margin", {})
-                    layout["margin"].setdefault("l", 10)
-                    layout["margin"].setdefault("r", 10)
-                    layout["margin"].setdefault("t", 40)
-                    layout["margin"].setdefault("b", 10)
-                    fig_layout = json.dumps(layout)
-                    parts.append(
+                    layout = {
+                        **_DEFAULT_LAYOUT,
+                        **layout,
+                        "margin": {**_DEFAULT_LAYOUT["margin"], **layout.get("margin", {})},
+                    }
+                    # Escape "</" so the payload cannot close its <script> early
+                    fig_json = _json_dumps(
+                        {"data": plotly_data.get("data", []), "layout": layout}
+                    ).replace("</", "<\\/")
+                    # Rendered lazily by the IntersectionObserver in _HTML_FOOT
+                    out.write(
                         f'<div id="{div_id}" class="plotly-graph-div" '
                         f'style="width:100%;"></div>\n'
-                        f'<script type="text/javascript">\n'
-                        f'Plotly.newPlot("{div_id}", {fig_data}, {fig_layout}, '
-                        f'{{"responsive": true, "displayModeBar": false}});\n'
-                        f'</script>'
+                        f'<script type="application/json" id="data-{div_id}">'
+                        f'{fig_json}</script>\n'
                     )
 
                 elif "text/html" in data:
                     html_content = "".join(data["text/html"])
                     if "<table" in html_content:
-                        parts.append(f'<div class="table-wrapper">{html_content}</div>')
+                        h = hashlib.blake2b(html_content.encode(), digest_size=8).hexdigest()
+                        out.write(
+                            f'<div class="table-wrapper" id="tbl-{h}">{html_content}</div>'
+                            f'<!--/tbl-{h}-->\n'
+                        )
                     else:
-                        parts.append(f'<div class="output-html">{html_content}</div>')
+                        out.write(f'<div class="output-html">{html_content}</div>\n')
 
                 elif "image/png" in data:
                     img_data = data["image/png"]
                     if isinstance(img_data, list):
                         img_data = "".join(img_data)
-                    parts.append(
+                    raw = base64.b64decode(img_data.strip())
+                    # Content-addressed, so identical plots across notebooks share a file
+                    img_name = f"{hashlib.blake2b(raw, digest_size=8).hexdigest()}.png"
+                    img_path = IMAGES_DIR / img_name
+                    # Keyed on the original bytes, so each image is recompressed only once;
+                    # written atomically since pool workers may race on the same file
+                    if not img_path.exists():
+                        _write_atomic(img_path, _optimize_png(raw))
+                    out.write(
                         f'<div class="output-image">'
-                        f'<img src="data:image/png;base64,{img_data.strip()}">'
-                        f'</div>'
+                        f'<img src="images/{img_name}" loading="lazy" decoding="async">'
+                        f'</div>\n'
                     )
 
             elif otype == "stream":
                 text = "".join(output.get("text", []))
                 if text.strip():
-                    parts.append(f'<pre class="output-text">{text}</pre>')
+                    out.write(f'<pre class="output-text">{text}</pre>\n')
 
-    return "\n".join(parts)
 
+def _dedupe_tables(fragment: str, seen: dict, page: str, title: str) -> str:
+    """Replace tables already in ``seen`` with a link back to their first occurrence.
 
-def main():
-    sections = []
-    for nb_name in NOTEBOOKS:
-        nb_path = NOTEBOOKS_DIR / nb_name
-        if not nb_path.exists():
-            print(f"Skipping {nb_name} (not found)")
-            continue
+    ``seen`` maps table hash -> (page, section title) where it first appeared, so
+    links can cross pages.
+    """
+    def repl(m):
+        h = m["h"]
+        if h in seen:
+            first_page, first_title = seen[h]
+            if first_page == page:
+                href, text = f"#tbl-{h}", "same table as above"
+            else:
+                href, text = f"{first_page}#tbl-{h}", f"same table as in {first_title}"
+            return f'<div class="table-wrapper"><a href="{href}">({text})</a></div>'
+        seen[h] = (page, title)
+        return m.group(0)
+
+    return _TABLE_BLOCK.sub(repl, fragment)
+
+
+def _write_page(path: Path, html: str) -> int:
+    """Minify and write a page plus its precompressed variants; returns its size."""
+    if minify_html is not None:
+        html = minify_html.minify(
+            html,
+            minify_css=True,
+            minify_js=True,
+            keep_closing_tags=True,
+            keep_html_and_head_opening_tags=True,
+        )
+    return _write_static(path, html.encode("utf-8"))
+
+
+def _write_static(path: Path, raw: bytes) -> int:
+    """Write a static file plus its precompressed variants; returns its size.
+
+    Files whose bytes are unchanged are left untouched, so static hosts and
+    browsers keep their cached copies.
+    """
+    gz_path = path.with_name(path.name + ".gz")
+    br_path = path.with_name(path.name + ".br")
+    if brotli is None:
+        # A .br left from a run with brotli would be served in place of new content
+        br_path.unlink(missing_ok=True)
+    variants = [gz_path, br_path] if brotli is not None else [gz_path]
+    if path.exists() and all(v.exists() for v in variants) and path.read_bytes() == raw:
+        return len(raw)
+
+    path.write_bytes(raw)
+    # Precompressed variants for static hosts that can serve them directly
+    with gzip.open(gz_path, "wb", compresslevel=9) as f:
+        f.write(raw)
+    if brotli is not None:
+        br_path.write_bytes(brotli.compress(raw, quality=11))
+    return len(raw)
+
+
+def _extract_section(nb_name: str):
+    """Pool worker: return ``(title, fragment)`` for a notebook, or None to skip it."""
+    nb_path = NOTEBOOKS_DIR / nb_name
+    if not nb_path.exists():
+        print(f"Skipping {nb_name} (not found)")
+        return None
+    st = nb_path.stat()
+    key = f"v{_CACHE_VERSION}-{st.st_mtime_ns}-{st.st_size}"
+    cache_path = CACHE_DIR / f"{nb_name}.{key}.html"
+    html_fragment = cache_path.read_text("utf-8") if cache_path.exists() else None
+    # A cached fragment is only usable while every image it links to still exists
+    if html_fragment is not None and all(
+        (IMAGES_DIR / name).exists() for name in _IMG_REF.findall(html_fragment)
+    ):
+        print(f"Using cached outputs for {nb_name}")
+    else:
         print(f"Extracting outputs from {nb_name} ...")
-        html_fragment = extract_outputs(nb_path)
-        if html_fragment:
-            title = nb_name.replace(".ipynb", "").replace("_", " ").title()
-            # Strip leading number prefix like "01 " or "16 "
-            title = title.lstrip("0123456789 ")
-            sections.append((title, html_fragment))
-
-    nav_items = []
-    content_sections = []
+        out = io.StringIO()
+        extract_outputs(nb_path, out)
+        html_fragment = out.getvalue()
+        for stale in CACHE_DIR.glob(f"{nb_name}.*.html"):
+            stale.unlink()
+        _write_atomic(cache_path, html_fragment.encode("utf-8"))
+    if not html_fragment:
+        return None
+    title = nb_name.replace(".ipynb", "").replace("_", " ").title()
+    # Strip leading number prefix like "01 " or "16 "
+    title = title.lstrip("0123456789 ")
+    return title, html_fragment
+
+
+def main():
+    # Notebooks are independent, so parse them in parallel; map() keeps order
+    with multiprocessing.Pool() as pool:
+        results = pool.map(_extract_section, NOTEBOOKS)
+    sections = [r for r in results if r is not None]
+
+    _write_static(DOCS_DIR / "report.css", _CSS.encode("utf-8"))
+
+    # Each notebook gets its own page, which report.html fetches on demand
+    seen_tables = {}
+    section_bytes = 0
     for i, (title, fragment) in enumerate(sections):
-        slug = f"section-{i}"
-        nav_items.append(f'<a href="#{slug}">{title}</a>')
-        content_sections.append(
-            f'<section id="{slug}">\n'
+        page = f"section-{i}.html"
+        # Done here rather than in the workers so repeats are caught across notebooks
+        fragment = _dedupe_tables(fragment, seen_tables, page, title)
+        out = io.StringIO()
+        out.write(_HTML_HEAD.format(title=f"{title} — Gun Violence Analysis"))
+        out.write(
+            f'<p><a href="report.html">&larr; Full report</a></p>\n'
+            f'<section id="section-{i}">\n'
             f'<h2 class="section-title">{title}</h2>\n'
             f'<div class="notebook-content">{fragment}</div>\n'
-            f'</section>\n<hr>\n'
+            f'</section>\n'
         )
+        out.write(_HTML_FOOT)
+        section_bytes += _write_page(DOCS_DIR / page, out.getvalue())
 
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-<meta charset="utf-8">
-<meta name="viewport" content="width=device-width, initial-scale=1">
-<link rel="icon" href="data:image/svg+xml,<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>🔫</text></svg>">
-<title>Gun Violence Analysis — Full Report</title>
-<script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
-<style>
-    * {{
-        box-sizing: border-box;
-    }}
-    body {{
-        font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Helvetica, Arial, sans-serif;
-        max-width: 1200px;
-        margin: 0 auto;
-        padding: 20px;
-        background: #fafafa;
-        color: #333;
-    }}
-    h1 {{
-        text-align: center;
-        color: #2c3e50;
-        border-bottom: 3px solid #e74c3c;
-        padding-bottom: 15px;
-        font-size: clamp(1.4rem, 4vw, 2rem);
-    }}
-    nav {{
-        display: flex;
-        flex-wrap: wrap;
-        justify-content: center;
-        gap: 8px 16px;
-        margin: 20px 0 30px;
-        padding: 15px;
-        background: #fff;
-        border-radius: 8px;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-    }}
-    nav a {{
-        color: #e74c3c;
-        text-decoration: none;
-        font-weight: 600;
-        font-size: 14px;
-        white-space: nowrap;
-    }}
-    nav a:hover {{
-        text-decoration: underline;
-    }}
-    .section-title {{
-        color: #2c3e50;
-        border-left: 4px solid #e74c3c;
-        padding-left: 12px;
-        font-size: clamp(1.1rem, 3vw, 1.5rem);
-    }}
-    section {{
-        background: #fff;
-        padding: 25px;
-        margin: 20px 0;
-        border-radius: 8px;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.1);
-        overflow: hidden;
-    }}
-    .notebook-content img {{
-        max-width: 100%;
-        height: auto;
-        display: block;
-        margin: 0 auto;
-    }}
-    .output-text {{
-        background: #f5f5f5;
-        padding: 10px;
-        border-radius: 4px;
-        overflow-x: auto;
-        font-size: 13px;
-        white-space: pre-wrap;
-        word-break: break-word;
-    }}
-    .table-wrapper {{
-        overflow-x: auto;
-        -webkit-overflow-scrolling: touch;
-        margin: 10px 0;
-    }}
-    .notebook-content table {{
-        border-collapse: collapse;
-        font-size: 13px;
-        min-width: 400px;
-    }}
-    .notebook-content table th,
-    .notebook-content table td {{
-        border: 1px solid #ddd;
-        padding: 6px 10px;
-        text-align: right;
-        white-space: nowrap;
-    }}
-    .notebook-content table th {{
-        background: #f0f0f0;
-        position: sticky;
-        top: 0;
-        z-index: 1;
-    }}
-    .output-image {{
-        text-align: center;
-        margin: 15px 0;
-        overflow-x: auto;
-    }}
-    .output-html {{
-        margin: 15px 0;
-        overflow-x: auto;
-    }}
-    hr {{
-        border: none;
-        border-top: 1px solid #eee;
-        margin: 30px 0;
-    }}
-    .plotly-graph-div {{
-        margin: 15px 0;
-        min-height: 350px;
-    }}
-    footer {{
-        text-align: center;
-        color: #999;
-        font-size: 13px;
-        margin-top: 40px;
-        padding: 20px;
-    }}
-    @media (max-width: 768px) {{
-        body {{
-            padding: 10px;
-        }}
-        section {{
-            padding: 12px;
-            margin: 10px 0;
-            border-radius: 6px;
-        }}
-        nav {{
-            padding: 10px;
-            gap: 6px 12px;
-        }}
-        nav a {{
-            font-size: 13px;
-        }}
-        .plotly-graph-div {{
-            min-height: 300px;
-        }}
-        .notebook-content table {{
-            font-size: 11px;
-        }}
-        .notebook-content table th,
-        .notebook-content table td {{
-            padding: 4px 6px;
-        }}
-        .output-text {{
-            font-size: 11px;
-            padding: 8px;
-        }}
-    }}
-</style>
-</head>
-<body>
-<h1>Gun Violence Analysis — Country-Level &amp; US County-Level Report</h1>
-<nav>
-    {"".join(nav_items)}
-</nav>
+    # Drop pages left over from notebooks that no longer produce a section
+    for stale in DOCS_DIR.glob("section-*.html*"):
+        m = re.fullmatch(r"section-(\d+)\.html(?:\.gz|\.br)?", stale.name)
+        if m and int(m[1]) >= len(sections):
+            stale.unlink()
 
-{"".join(content_sections)}
-
-<footer>
-    Generated from Jupyter notebooks. Data sources: World Bank, UNODC, Census ACS, CDC WONDER, FBI UCR, RAND, Giffords Law Center, Gun Violence Archive, SAMHSA NSDUH.
-</footer>
-</body>
-</html>"""
+    # Stream the index into one buffer instead of joining big lists
+    out = io.StringIO()
+    out.write(_HTML_HEAD.format(title=_REPORT_TITLE))
+    out.write("<h1>Gun Violence Analysis — Country-Level &amp; US County-Level Report</h1>\n")
+    out.write("<nav>\n    ")
+    for i, (title, _) in enumerate(sections):
+        out.write(f'<a href="#section-{i}">{title}</a>')
+    out.write("\n</nav>\n\n")
+    for i, (title, _) in enumerate(sections):
+        out.write(
+            f'<section id="section-{i}" data-src="section-{i}.html">\n'
+            f'<h2 class="section-title">{title}</h2>\n'
+            f'<div class="notebook-content">'
+            f'<p><a href="section-{i}.html">Open this section</a></p></div>\n'
+            f'</section>\n<hr>\n'
+        )
+    out.write(_HTML_FOOT)
 
     out_path = DOCS_DIR / "report.html"
-    out_path.write_text(html)
-    print(f"\nWrote combined report to {out_path}")
-    print(f"  File size: {out_path.stat().st_size:,} bytes")
+    size = _write_page(out_path, out.getvalue())
+    print(f"\nWrote report index to {out_path}")
+    print(f"  File size: {size:,} bytes")
+    print(f"Wrote {len(sections)} section pages ({section_bytes:,} bytes total)")
 
 
 if __name__ == "__main__":